@@ -1,7 +1,7 @@
 """Business logic for destination management"""
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy import select, delete
+from sqlalchemy import select, delete, func, event
 from typing import List, Optional
 import logging
 from datetime import datetime
@@ -19,6 +19,15 @@ engine = create_async_engine(
     future=True
 )
 
+if engine.dialect.name == "sqlite":
+    @event.listens_for(engine.sync_engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        """Use WAL so reads aren't blocked by writes and commits avoid a full fsync"""
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.close()
+
 async_session_maker = sessionmaker(
     engine, class_=AsyncSession, expire_on_commit=False
 )
@@ -70,9 +79,8 @@ class DestinationService:
             Created Destination object
         """
         # Generate ID
-        result = await self.session.execute(select(Destination))
-        existing = result.scalars().all()
-        dest_id = f"{dest_type}:{len(existing) + 1}"
+        result = await self.session.execute(select(func.count()).select_from(Destination))
+        dest_id = f"{dest_type}:{result.scalar_one() + 1}"
         
         # Create destination
         destination = Destination(
@@ -2,16 +2,29 @@ import os
 import subprocess
 import json
 import socket
+import ctypes
+import struct
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from flask import Flask, render_template, request, jsonify, Response, stream_with_context
 import sys
 import uuid
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor, Future, as_completed
 import threading
 import queue
+import hashlib
+import gzip
+import re
+import selectors
 import logging
 
+try:
+    import orjson
+except ImportError:  # optional speedup, fall back to stdlib json
+    orjson = None
+
 app = Flask(__name__)
 
 # Setup logging
@@ -21,20 +34,95 @@ logger = logging.getLogger(__name__)
 EVENT_GENERATORS_DIR = os.path.join(os.getcwd(), 'event_generators')
 API_BASE_URL = os.environ.get('API_BASE_URL', 'http://localhost:8000')
 BACKEND_API_KEY = os.environ.get('BACKEND_API_KEY')
+GENERATORS_CACHE_TTL = float(os.environ.get('GENERATORS_CACHE_TTL', '30'))
+GENERATOR_PAGE_WORKERS = 8
+DESTINATIONS_CACHE_TTL = float(os.environ.get('DESTINATIONS_CACHE_TTL', '10'))
+GZIP_MIN_SIZE = 1024
+
+# The index template takes no context, so its output only changes with the file itself
+_INDEX_CACHE = {'entry': None}
 
 @app.route('/')
 def index():
-    return render_template('log_generator.html')
+    if app.jinja_env.auto_reload:
+        return render_template('log_generator.html')
+    if _INDEX_CACHE['entry'] is None:
+        body = render_template('log_generator.html').encode('utf-8')
+        _INDEX_CACHE['entry'] = {'body': body, 'etag': _etag(body), 'gzip': _gzip_body(body)}
+    return _cached_response(_INDEX_CACHE['entry'], mimetype='text/html')
+
+# Cached result of the event_generators directory walk. 'dirs' holds every
+# directory seen during the last walk; the cache stays valid while none of
+# their mtimes change (adding/removing a file or subdirectory bumps its parent).
+_SCRIPTS_CACHE = {'dirs': (), 'mtimes': None, 'entry': None}
+_SCRIPTS_LOCK = threading.Lock()
+
+def _dir_mtimes(dirs):
+    try:
+        return tuple(os.stat(d).st_mtime_ns for d in dirs)
+    except OSError:
+        return None
+
+def _scripts_entry():
+    with _SCRIPTS_LOCK:
+        cached = _SCRIPTS_CACHE['entry']
+        if cached is not None and _SCRIPTS_CACHE['dirs']:
+            # None means a directory vanished (now or since the walk): always rescan then
+            mtimes = _dir_mtimes(_SCRIPTS_CACHE['dirs'])
+            if mtimes is not None and mtimes == _SCRIPTS_CACHE['mtimes']:
+                return cached
+        dirs = []
+        scripts = _scan_scripts(dirs)
+        _SCRIPTS_CACHE['dirs'] = tuple(dirs)
+        _SCRIPTS_CACHE['mtimes'] = _dir_mtimes(dirs)
+        # Categories sorted by name, matching the order jsonify used to emit
+        scripts = dict(sorted(scripts.items()))
+        entry = _cache_entry(scripts, scripts)
+        # Real paths of every listed script: the allowlist for /generate-logs
+        entry['paths'] = frozenset(
+            os.path.realpath(os.path.join(EVENT_GENERATORS_DIR, path))
+            for paths in scripts.values() for path in paths
+        )
+        # UI-supplied path -> resolved real path, filled lazily on successful lookups
+        entry['resolved'] = {}
+        _SCRIPTS_CACHE['entry'] = entry
+        return entry
 
 def get_scripts():
+    return _scripts_entry()['value']
+
+def _resolve_script_path(script_path):
+    """Map a UI-supplied script path (relative or absolute) to a listed generator script.
+
+    Returns None for anything that doesn't resolve to a script found under
+    EVENT_GENERATORS_DIR, which also rules out path traversal.
+    """
+    if not script_path:
+        return None
+    entry = _scripts_entry()
+    full_path = entry['resolved'].get(script_path)
+    if full_path is None:
+        full_path = os.path.realpath(os.path.join(EVENT_GENERATORS_DIR, script_path))
+        if full_path not in entry['paths']:
+            return None
+        entry['resolved'][script_path] = full_path
+    return full_path
+
+def _scan_scripts(seen_dirs):
     scripts = {}
     try:
         if not os.path.exists(EVENT_GENERATORS_DIR):
             return scripts
+        # os.walk roots all start with the base dir, so slicing is enough to make them relative
+        prefix_len = len(os.path.join(EVENT_GENERATORS_DIR, ''))
         for root, dirs, files in os.walk(EVENT_GENERATORS_DIR):
+            # Prune bytecode caches and hidden dirs before descending: they hold no
+            # scripts, and their mtimes change whenever a generator is imported
+            dirs[:] = [d for d in dirs if d != '__pycache__' and not d.startswith('.')]
+            seen_dirs.append(root)
             py_files = sorted([f for f in files if f.endswith('.py')])
             if py_files:
-                relative_root = os.path.relpath(root, EVENT_GENERATORS_DIR)
+                relative_root = root[prefix_len:] or '.'
                 if relative_root == '.':
                     category_name = "Uncategorized"
                 else:
@@ -44,6 +132,65 @@ def get_scripts():
         print(f"Error scanning for scripts: {e}")
     return scripts
 
+def _json_loads(data):
+    """Parse JSON bytes/str, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _json_dumps(obj):
+    """Serialize obj to JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
+
+def _request_json(silent=False):
+    """Parse the request body as JSON, using orjson when available.
+
+    Mirrors request.get_json(): non-JSON content types and malformed bodies
+    raise the usual 415/400 errors, or return None when silent.
+    """
+    if orjson is None or not request.is_json:
+        return request.get_json(silent=silent)
+    try:
+        return orjson.loads(request.get_data())
+    except orjson.JSONDecodeError as e:
+        if silent:
+            return None
+        return request.on_json_loading_failed(e)
+
+def _etag(body):
+    return hashlib.blake2b(body, digest_size=8).hexdigest()
+
+def _gzip_body(body):
+    """Gzip-compressed copy of body, or None when it is too small to be worth it"""
+    if len(body) < GZIP_MIN_SIZE:
+        return None
+    # mtime=0 keeps the output deterministic for identical bodies
+    return gzip.compress(body, mtime=0)
+
+def _cache_entry(value, payload):
+    """Cache entry holding value plus the response body for payload, encoded once per refresh"""
+    body = _json_dumps(payload)
+    return {'value': value, 'body': body, 'etag': _etag(body), 'gzip': _gzip_body(body)}
+
+def _cached_response(entry, mimetype='application/json'):
+    """Respond with a cached body, or 304 Not Modified if the client's If-None-Match matches"""
+    gzipped = entry.get('gzip')
+    if gzipped is not None and request.accept_encodings['gzip'] > 0:
+        resp = Response(gzipped, mimetype=mimetype)
+        resp.headers['Content-Encoding'] = 'gzip'
+        # The compressed representation needs its own validator
+        resp.set_etag(entry['etag'] + '-gz')
+    else:
+        resp = Response(entry['body'], mimetype=mimetype)
+        resp.set_etag(entry['etag'])
+    if gzipped is not None:
+        resp.vary.add('Accept-Encoding')
+    # Clients must revalidate each time so destination changes show up immediately
+    resp.headers['Cache-Control'] = 'private, no-cache'
+    return resp.make_conditional(request)
+
 def _get_api_headers():
     """Get headers for backend API requests"""
     headers = {}
@@ -51,73 +198,222 @@ def _get_api_headers():
         headers['X-API-Key'] = BACKEND_API_KEY
     return headers
 
+def _create_api_session():
+    """Shared session for backend API calls so connections are pooled and reused"""
+    session = requests.Session()
+    # Retry only connection failures: a request that reached the backend is never resent,
+    # so hung calls fail after one timeout and a DELETE can't be replayed into a 404
+    adapter = HTTPAdapter(pool_maxsize=32, max_retries=Retry(total=2, read=0, backoff_factor=0.2))
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    session.headers.update(_get_api_headers())
+    return session
+
+_SESSION = _create_api_session()
+
+def _single_flight(cache, lock, fetch):
+    """Refresh cache via fetch() once on behalf of all concurrent callers.
+
+    fetch() returns (entry, detail) and runs without the lock held. The first
+    caller runs it; callers arriving meanwhile wait on its Future and share the
+    outcome, failures and exceptions included, so a slow or down backend is hit
+    once per refresh rather than once per waiting request. A successful entry
+    is stored unless cache['generation'] was bumped while fetch() ran.
+    """
+    with lock:
+        future = cache['inflight']
+        if future is not None:
+            leader = False
+        else:
+            leader = True
+            future = cache['inflight'] = Future()
+            generation = cache['generation']
+    if not leader:
+        return future.result()
+    try:
+        result = fetch()
+    except Exception as e:
+        with lock:
+            if cache['inflight'] is future:
+                cache['inflight'] = None
+        future.set_exception(e)
+        raise
+    with lock:
+        if cache['inflight'] is future:
+            cache['inflight'] = None
+        if result[0] is not None and cache['generation'] == generation:
+            cache['entry'] = result[0]
+            cache['ts'] = time.monotonic()
+    future.set_result(result)
+    return result
+
+# Simplified generator list from the backend, refreshed at most every GENERATORS_CACHE_TTL seconds
+_GEN_CACHE = {'ts': 0.0, 'entry': None, 'inflight': None, 'generation': 0}
+_GEN_LOCK = threading.Lock()
+
+def _generators_entry():
+    """Return (cache_entry, error), serving from the in-process cache while it is fresh"""
+    with _GEN_LOCK:
+        if _GEN_CACHE['entry'] is not None and time.monotonic() - _GEN_CACHE['ts'] < GENERATORS_CACHE_TTL:
+            return _GEN_CACHE['entry'], None
+    return _single_flight(_GEN_CACHE, _GEN_LOCK, _fetch_generators_entry)
+
+def _fetch_generators_entry():
+    data, err = _fetch_generators_from_backend()
+    if err is not None:
+        return None, err
+    return _cache_entry(data, {'generators': data}), None
+
 def fetch_generators():
+    """Return (generators, error)"""
+    entry, err = _generators_entry()
+    return (entry['value'] if entry else None), err
+
+def _simplify_generators(payload):
+    """Reduce a backend generators page to the dropdown fields: {id, name, category, file_path}"""
+    return [
+        {
+            'id': g.get('id'),
+            'name': g.get('name'),
+            'category': g.get('category'),
+            'file_path': g.get('file_path')
+        }
+        for g in payload.get('data', {}).get('generators', [])
+    ]
+
+def _fetch_generators_from_backend():
     base_url = f"{API_BASE_URL}/api/v1/generators"
     try:
-        headers = {'X-API-Key': BACKEND_API_KEY} if BACKEND_API_KEY else None
-        all_items = []
         # First try to request a large page to avoid pagination
-        resp = requests.get(base_url, params={'page': 1, 'per_page': 500}, headers=headers, timeout=20)
+        resp = _SESSION.get(base_url, params={'page': 1, 'per_page': 500}, timeout=20)
         if resp.status_code == 200:
-            payload = resp.json()
-            data = payload.get('data', {})
-            all_items = data.get('generators', [])
-        else:
-            # Fallback to default pagination loop
-            page = 1
-            total_pages = 1
-            while page <= total_pages:
-                resp = requests.get(base_url, params={'page': page}, headers=headers, timeout=20)
-                if resp.status_code != 200:
-                    # If we already have some items, return them rather than hard-fail
-                    if all_items:
+            return _simplify_generators(_json_loads(resp.content)), None
+
+        # Fallback to default pagination: page 1 tells us total_pages,
+        # the remaining pages are fetched concurrently
+        resp = _SESSION.get(base_url, params={'page': 1}, timeout=20)
+        if resp.status_code != 200:
+            return None, f"Backend returned {resp.status_code}: {resp.text}"
+        payload = _json_loads(resp.content)
+        simplified = _simplify_generators(payload)
+        pagination = payload.get('metadata', {}).get('pagination', {})
+        total_pages = int(pagination.get('total_pages', 1)) or 1
+
+        if total_pages > 1:
+            def _fetch_page(page):
+                return _SESSION.get(base_url, params={'page': page}, timeout=20)
+
+            with ThreadPoolExecutor(max_workers=min(GENERATOR_PAGE_WORKERS, total_pages - 1)) as executor:
+                # map() preserves page order
+                for resp in executor.map(_fetch_page, range(2, total_pages + 1)):
+                    if resp.status_code != 200:
+                        # Return the pages we already have rather than hard-fail
                         break
-                    return None, f"Backend returned {resp.status_code}: {resp.text}"
-                payload = resp.json()
-                data = payload.get('data', {})
-                items = data.get('generators', [])
-                all_items.extend(items)
-                meta = payload.get('metadata', {})
-                pagination = meta.get('pagination', {})
-                total_pages = int(pagination.get('total_pages', total_pages)) or 1
-                page += 1
-
-        # Simplify for dropdown: list of {id, name, category, file_path}
-        simplified = [
-            {
-                'id': g.get('id'),
-                'name': g.get('name'),
-                'category': g.get('category'),
-                'file_path': g.get('file_path')
-            }
-            for g in all_items
-        ]
+                    simplified.extend(_simplify_generators(_json_loads(resp.content)))
         return simplified, None
     except Exception as e:
         return None, str(e)
 
 @app.route('/get-generators', methods=['GET'])
 def get_generators():
-    data, err = fetch_generators()
+    entry, err = _generators_entry()
     if err:
         return jsonify({'error': f'Failed to fetch generators from backend: {err}'}), 502
-    return jsonify({'generators': data})
+    return _cached_response(entry)
+
+# Destinations list from the backend, refreshed at most every DESTINATIONS_CACHE_TTL
+# seconds and dropped whenever a destination is created or deleted through this UI
+_DESTS_CACHE = {'ts': 0.0, 'entry': None, 'inflight': None, 'generation': 0}
+_DESTS_LOCK = threading.Lock()
+
+def _destinations_entry():
+    """Return (cache_entry, status_code); cache_entry is None if the backend call failed"""
+    with _DESTS_LOCK:
+        if _DESTS_CACHE['entry'] is not None and time.monotonic() - _DESTS_CACHE['ts'] < DESTINATIONS_CACHE_TTL:
+            return _DESTS_CACHE['entry'], 200
+    return _single_flight(_DESTS_CACHE, _DESTS_LOCK, _fetch_destinations_entry)
+
+def _fetch_destinations_entry():
+    resp = _SESSION.get(
+        f"{API_BASE_URL}/api/v1/destinations",
+        timeout=10
+    )
+    if resp.status_code != 200:
+        logger.error(f"Backend returned {resp.status_code}: {resp.text}")
+        return None, resp.status_code
+    items = _json_loads(resp.content)
+    return _cache_entry(items, {'destinations': items}), 200
+
+def _load_destinations():
+    """Return (destinations, status_code); destinations is None if the backend call failed"""
+    entry, status_code = _destinations_entry()
+    return (entry['value'] if entry else None), status_code
+
+# Decrypted HEC tokens by (destination id, url), so repeat runs against the same
+# destination skip the backend token round trip. Shares DESTINATIONS_CACHE_TTL and is
+# cleared together with the destinations cache. Ids can be reused after a delete, so
+# the url is part of the key: a recreated destination never matches an old token.
+_TOKEN_CACHE = {}
+_TOKEN_LOCK = threading.Lock()
+
+def _get_hec_token(dest_id, url):
+    """Return (token, status_code) for the destination resolved as (dest_id, url);
+    token is None if the backend call failed"""
+    key = (dest_id, url)
+    with _TOKEN_LOCK:
+        cached = _TOKEN_CACHE.get(key)
+        if cached and time.monotonic() - cached[0] < DESTINATIONS_CACHE_TTL:
+            return cached[1], 200
+    resp = _SESSION.get(
+        f"{API_BASE_URL}/api/v1/destinations/{dest_id}/token",
+        timeout=10
+    )
+    if resp.status_code != 200:
+        return None, resp.status_code
+    token = resp.json().get('token')
+    if token:
+        with _TOKEN_LOCK:
+            _TOKEN_CACHE[key] = (time.monotonic(), token)
+    return token, 200
+
+def _resolve_destination(items, dest_id):
+    """Find dest_id in an already-loaded destinations list.
+
+    Falls back to asking the backend for that id directly, for destinations
+    created elsewhere since the list was cached. Returns None if not found.
+    """
+    for dest in items or ():
+        if dest.get('id') == dest_id:
+            return dest
+    resp = _SESSION.get(
+        f"{API_BASE_URL}/api/v1/destinations/{dest_id}",
+        timeout=10
+    )
+    if resp.status_code != 200:
+        return None
+    return _json_loads(resp.content)
+
+def _invalidate_destinations():
+    with _DESTS_LOCK:
+        _DESTS_CACHE['entry'] = None
+        # A refresh already in flight may predate the change: stop it from storing its
+        # result, and have later callers start a new fetch instead of joining it
+        _DESTS_CACHE['generation'] += 1
+        _DESTS_CACHE['inflight'] = None
+    with _TOKEN_LOCK:
+        _TOKEN_CACHE.clear()
+    # Don't keep connections open to syslog servers that may no longer be configured
+    _drain_syslog_pool()
 
 @app.route('/destinations', methods=['GET'])
 def list_destinations():
     """List destinations from backend API"""
     try:
-        resp = requests.get(
-            f"{API_BASE_URL}/api/v1/destinations",
-            headers=_get_api_headers(),
-            timeout=10
-        )
-        if resp.status_code == 200:
-            destinations = resp.json()
-            return jsonify({'destinations': destinations})
+        entry, status_code = _destinations_entry()
+        if entry is not None:
+            return _cached_response(entry)
         else:
-            logger.error(f"Backend returned {resp.status_code}: {resp.text}")
-            return jsonify({'error': f'Backend error: {resp.status_code}'}), resp.status_code
+            return jsonify({'error': f'Backend error: {status_code}'}), status_code
     except Exception as e:
         logger.error(f"Failed to fetch destinations: {e}")
         return jsonify({'error': str(e)}), 500
@@ -125,20 +421,22 @@ def list_destinations():
 @app.route('/destinations', methods=['POST'])
 def create_destination():
     """Create destination via backend API"""
-    payload = request.get_json(silent=True) or {}
+    payload = _request_json(silent=True) or {}
     
     logger.info(f"Creating destination: type={payload.get('type')}, name={payload.get('name')}")
     
     try:
-        resp = requests.post(
+        resp = _SESSION.post(
             f"{API_BASE_URL}/api/v1/destinations",
-            json=payload,
-            headers=_get_api_headers(),
+            data=_json_dumps(payload),
+            headers={'Content-Type': 'application/json'},
             timeout=10
         )
         
         if resp.status_code == 201:
-            return jsonify(resp.json()), 201
+            _invalidate_destinations()
+            # Relay the backend's JSON body as-is rather than decoding and re-encoding it
+            return Response(resp.content, status=201, mimetype='application/json')
         else:
             error_detail = resp.json().get('detail', resp.text) if resp.headers.get('content-type') == 'application/json' else resp.text
             logger.error(f"Backend returned {resp.status_code}: {error_detail}")
@@ -151,12 +449,14 @@ def create_destination():
 def delete_destination(dest_id: str):
     """Delete destination via backend API"""
     try:
-        resp = requests.delete(
+        resp = _SESSION.delete(
             f"{API_BASE_URL}/api/v1/destinations/{dest_id}",
-            headers=_get_api_headers(),
             timeout=10
         )
         
+        if resp.status_code in (204, 404):
+            # Gone either way: a 404 can also mean it was deleted elsewhere since the list was cached
+            _invalidate_destinations()
         if resp.status_code == 204:
             return ('', 204)
         else:
@@ -167,106 +467,190 @@ def delete_destination(dest_id: str):
         logger.error(f"Failed to delete destination: {e}")
         return jsonify({'error': str(e)}), 500
 
+SCENARIOS = [
+    {
+        'id': 'attack_scenario_orchestrator',
+        'name': 'Operation Digital Heist',
+        'description': 'Sophisticated 14-day APT campaign against a financial services company. Simulates reconnaissance, initial access, persistence, privilege escalation, and data exfiltration.',
+        'duration_days': 14,
+        'events_per_day': 50,
+        'total_events': 700,
+        'phases': ['Reconnaissance & Phishing', 'Initial Access', 'Persistence & Lateral Movement', 'Privilege Escalation', 'Data Exfiltration']
+    },
+    {
+        'id': 'enterprise_attack_scenario',
+        'name': 'Enterprise Breach Scenario',
+        'description': 'Enhanced enterprise attack scenario with 330+ events across multiple security products. Demonstrates correlated attack patterns.',
+        'duration_minutes': 60,
+        'total_events': 330,
+        'phases': ['Initial Compromise', 'Credential Harvesting', 'Lateral Movement', 'Privilege Escalation', 'Data Exfiltration', 'Persistence']
+    },
+    {
+        'id': 'enterprise_attack_scenario_10min',
+        'name': 'Enterprise Breach (10 min)',
+        'description': 'Condensed enterprise breach scenario for quick demos.',
+        'duration_minutes': 10,
+        'total_events': 120,
+        'phases': ['Initial Access', 'Lateral Movement', 'Exfiltration']
+    },
+    {
+        'id': 'enterprise_scenario_sender',
+        'name': 'Enterprise Scenario Sender (330+ events)',
+        'description': 'Sends enhanced enterprise attack scenario events to HEC using proper routing.',
+        'duration_minutes': 45,
+        'total_events': 330,
+        'phases': ['Initial Compromise', 'Credential Harvesting', 'Lateral Movement', 'Privilege Escalation', 'Data Exfiltration']
+    },
+    {
+        'id': 'enterprise_scenario_sender_10min',
+        'name': 'Enterprise Scenario Sender (10 min)',
+        'description': 'Fast sender for enterprise scenario suitable for time-boxed demos.',
+        'duration_minutes': 10,
+        'total_events': 120,
+        'phases': ['Initial Access', 'Lateral Movement', 'Exfiltration']
+    },
+    {
+        'id': 'showcase_attack_scenario',
+        'name': 'AI-SIEM Showcase Scenario',
+        'description': 'Showcase scenario demonstrating multi-platform correlation across EDR, Email, Identity, Cloud, Network, WAF, and more.',
+        'duration_minutes': 30,
+        'total_events': 200,
+        'phases': ['Phishing', 'Compromise', 'Movement', 'Privilege Escalation', 'Exfiltration']
+    },
+    {
+        'id': 'showcase_scenario_sender',
+        'name': 'Showcase Scenario Sender',
+        'description': 'Sends the showcase scenario events to HEC with compact progress output.',
+        'duration_minutes': 20,
+        'total_events': 180,
+        'phases': ['Phishing', 'Compromise', 'Movement', 'Exfiltration']
+    },
+    {
+        'id': 'quick_scenario',
+        'name': 'Quick Scenario (Comprehensive)',
+        'description': 'Generates a compact yet comprehensive attack scenario spanning multiple sources.',
+        'duration_minutes': 5,
+        'total_events': 80,
+        'phases': ['Initial Access', 'Reconnaissance', 'Movement', 'Exfiltration']
+    },
+    {
+        'id': 'quick_scenario_simple',
+        'name': 'Quick Scenario (Simple)',
+        'description': 'Minimal scenario for smoke testing pipeline and parsers.',
+        'duration_minutes': 2,
+        'total_events': 30,
+        'phases': ['Access', 'Movement']
+    },
+    {
+        'id': 'scenario_hec_sender',
+        'name': 'Scenario HEC Sender',
+        'description': 'Generic scenario sender that replays a scenario JSON to HEC.',
+        'duration_minutes': 15,
+        'total_events': 150,
+        'phases': ['Replay']
+    },
+    {
+        'id': 'star_trek_integration_test',
+        'name': 'Integration Test (Star Trek)',
+        'description': 'Integration test scenario for end-to-end validation and fun output.',
+        'duration_minutes': 3,
+        'total_events': 20,
+        'phases': ['Test']
+    }
+]
+
+# Map scenario ids to filenames when they differ
+SCENARIO_FILES = {
+    'attack_scenario_orchestrator': 'attack_scenario_orchestrator.py',
+    'enterprise_attack_scenario': 'enterprise_attack_scenario.py',
+    'enterprise_attack_scenario_10min': 'enterprise_attack_scenario_10min.py',
+    'enterprise_scenario_sender': 'enterprise_scenario_sender.py',
+    'enterprise_scenario_sender_10min': 'enterprise_scenario_sender_10min.py',
+    'showcase_attack_scenario': 'showcase_attack_scenario.py',
+    'showcase_scenario_sender': 'showcase_scenario_sender.py',
+    'quick_scenario': 'quick_scenario.py',
+    'quick_scenario_simple': 'quick_scenario_simple.py',
+    'scenario_hec_sender': 'scenario_hec_sender.py',
+    'star_trek_integration_test': 'star_trek_integration_test.py',
+}
+
+_SCENARIOS_ENTRY = _cache_entry(SCENARIOS, {'scenarios': SCENARIOS})
+
+SCENARIOS_DIR = os.path.realpath(os.path.join(os.path.dirname(__file__), '..', 'Backend', 'scenarios'))
+# Scenario id -> resolved script path, filled lazily on successful lookups
+_SCENARIO_PATHS = {}
+
+def _resolve_scenario_path(scenario_id):
+    """Return the script path for scenario_id, or None if it isn't a file inside SCENARIOS_DIR"""
+    script_path = _SCENARIO_PATHS.get(scenario_id)
+    if script_path is None:
+        filename = SCENARIO_FILES.get(scenario_id, f"{scenario_id}.py")
+        script_path = os.path.realpath(os.path.join(SCENARIOS_DIR, filename))
+        if os.path.dirname(script_path) != SCENARIOS_DIR or not os.path.isfile(script_path):
+            return None
+        _SCENARIO_PATHS[scenario_id] = script_path
+    return script_path
+
+def _scenario_pythonpath():
+    """Event generators dir plus its category subdirectories, for scenario script imports"""
+    event_generators_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'Backend', 'event_generators'))
+    python_paths = [event_generators_dir]
+    categories = ['cloud_infrastructure', 'network_security', 'endpoint_security',
+                  'identity_access', 'email_security', 'web_security', 'infrastructure', 'shared']
+    for category in categories:
+        category_path = os.path.join(event_generators_dir, category)
+        if os.path.exists(category_path):
+            python_paths.append(category_path)
+    return python_paths
+
+SCENARIO_PYTHONPATH = _scenario_pythonpath()
+
 @app.route('/scenarios', methods=['GET'])
 def list_scenarios():
     """List available attack scenarios"""
-    scenarios = [
-        {
-            'id': 'attack_scenario_orchestrator',
-            'name': 'Operation Digital Heist',
-            'description': 'Sophisticated 14-day APT campaign against a financial services company. Simulates reconnaissance, initial access, persistence, privilege escalation, and data exfiltration.',
-            'duration_days': 14,
-            'events_per_day': 50,
-            'total_events': 700,
-            'phases': ['Reconnaissance & Phishing', 'Initial Access', 'Persistence & Lateral Movement', 'Privilege Escalation', 'Data Exfiltration']
-        },
-        {
-            'id': 'enterprise_attack_scenario',
-            'name': 'Enterprise Breach Scenario',
-            'description': 'Enhanced enterprise attack scenario with 330+ events across multiple security products. Demonstrates correlated attack patterns.',
-            'duration_minutes': 60,
-            'total_events': 330,
-            'phases': ['Initial Compromise', 'Credential Harvesting', 'Lateral Movement', 'Privilege Escalation', 'Data Exfiltration', 'Persistence']
-        },
-        {
-            'id': 'enterprise_attack_scenario_10min',
-            'name': 'Enterprise Breach (10 min)',
-            'description': 'Condensed enterprise breach scenario for quick demos.',
-            'duration_minutes': 10,
-            'total_events': 120,
-            'phases': ['Initial Access', 'Lateral Movement', 'Exfiltration']
-        },
-        {
-            'id': 'enterprise_scenario_sender',
-            'name': 'Enterprise Scenario Sender (330+ events)',
-            'description': 'Sends enhanced enterprise attack scenario events to HEC using proper routing.',
-            'duration_minutes': 45,
-            'total_events': 330,
-            'phases': ['Initial Compromise', 'Credential Harvesting', 'Lateral Movement', 'Privilege Escalation', 'Data Exfiltration']
-        },
-        {
-            'id': 'enterprise_scenario_sender_10min',
-            'name': 'Enterprise Scenario Sender (10 min)',
-            'description': 'Fast sender for enterprise scenario suitable for time-boxed demos.',
-            'duration_minutes': 10,
-            'total_events': 120,
-            'phases': ['Initial Access', 'Lateral Movement', 'Exfiltration']
-        },
-        {
-            'id': 'showcase_attack_scenario',
-            'name': 'AI-SIEM Showcase Scenario',
-            'description': 'Showcase scenario demonstrating multi-platform correlation across EDR, Email, Identity, Cloud, Network, WAF, and more.',
-            'duration_minutes': 30,
-            'total_events': 200,
-            'phases': ['Phishing', 'Compromise', 'Movement', 'Privilege Escalation', 'Exfiltration']
-        },
-        {
-            'id': 'showcase_scenario_sender',
-            'name': 'Showcase Scenario Sender',
-            'description': 'Sends the showcase scenario events to HEC with compact progress output.',
-            'duration_minutes': 20,
-            'total_events': 180,
-            'phases': ['Phishing', 'Compromise', 'Movement', 'Exfiltration']
-        },
-        {
-            'id': 'quick_scenario',
-            'name': 'Quick Scenario (Comprehensive)',
-            'description': 'Generates a compact yet comprehensive attack scenario spanning multiple sources.',
-            'duration_minutes': 5,
-            'total_events': 80,
-            'phases': ['Initial Access', 'Reconnaissance', 'Movement', 'Exfiltration']
-        },
-        {
-            'id': 'quick_scenario_simple',
-            'name': 'Quick Scenario (Simple)',
-            'description': 'Minimal scenario for smoke testing pipeline and parsers.',
-            'duration_minutes': 2,
-            'total_events': 30,
-            'phases': ['Access', 'Movement']
-        },
-        {
-            'id': 'scenario_hec_sender',
-            'name': 'Scenario HEC Sender',
-            'description': 'Generic scenario sender that replays a scenario JSON to HEC.',
-            'duration_minutes': 15,
-            'total_events': 150,
-            'phases': ['Replay']
-        },
-        {
-            'id': 'star_trek_integration_test',
-            'name': 'Integration Test (Star Trek)',
-            'description': 'Integration test scenario for end-to-end validation and fun output.',
-            'duration_minutes': 3,
-            'total_events': 20,
-            'phases': ['Test']
-        }
-    ]
-    return jsonify({'scenarios': scenarios})
+    return _cached_response(_SCENARIOS_ENTRY)
+
+def _iter_process_lines(process):
+    """Yield (stream_name, line) from a Popen's stdout/stderr pipes as lines complete.
+
+    Both pipes are drained together through a selector in 64 KiB reads, so output
+    on stderr can't fill its pipe and stall the child while stdout is being read.
+    """
+    sel = selectors.DefaultSelector()
+    buffers = {}
+    for name, pipe in (('stdout', process.stdout), ('stderr', process.stderr)):
+        if pipe is not None:
+            sel.register(pipe.fileno(), selectors.EVENT_READ, name)
+            buffers[name] = bytearray()
+    try:
+        while sel.get_map():
+            for key, _ in sel.select():
+                buf = buffers[key.data]
+                chunk = os.read(key.fd, 65536)
+                if not chunk:
+                    sel.unregister(key.fd)
+                    if buf:
+                        tail = buf.decode('utf-8', 'replace')
+                        buf.clear()
+                        yield key.data, tail
+                    continue
+                buf += chunk
+                start = 0
+                while True:
+                    end = buf.find(b'\n', start) + 1
+                    if not end:
+                        break
+                    line = buf[start:end].decode('utf-8', 'replace')
+                    start = end
+                    yield key.data, line
+                del buf[:start]
+    finally:
+        sel.close()
 
 @app.route('/scenarios/run', methods=['POST'])
 def run_scenario():
     """Execute a scenario and stream progress"""
-    data = request.json
+    data = _request_json()
     scenario_id = data.get('scenario_id')
     destination_id = data.get('destination_id')
     worker_count = int(data.get('workers', 10))  # Default 10 parallel workers
@@ -278,32 +662,21 @@ def run_scenario():
     
     # Resolve destination from backend API
     try:
-        dest_resp = requests.get(
-            f"{API_BASE_URL}/api/v1/destinations/{destination_id}",
-            headers=_get_api_headers(),
-            timeout=10
-        )
-        if dest_resp.status_code != 200:
+        destinations, _ = _load_destinations()
+        chosen = _resolve_destination(destinations, destination_id)
+        if not chosen:
             return jsonify({'error': 'Destination not found'}), 404
         
-        chosen = dest_resp.json()
-        
         if chosen.get('type') != 'hec':
             return jsonify({'error': 'Scenarios currently only support HEC destinations'}), 400
         
         hec_url = chosen.get('url')
         
         # Fetch decrypted token from backend
-        token_resp = requests.get(
-            f"{API_BASE_URL}/api/v1/destinations/{destination_id}/token",
-            headers=_get_api_headers(),
-            timeout=10
-        )
-        if token_resp.status_code != 200:
+        hec_token, token_status = _get_hec_token(destination_id, hec_url)
+        if token_status != 200:
             return jsonify({'error': 'Failed to retrieve HEC token'}), 400
         
-        hec_token = token_resp.json().get('token')
-        
         if not hec_url or not hec_token:
             return jsonify({'error': 'HEC destination incomplete or token missing'}), 400
     except Exception as e:
@@ -313,25 +686,10 @@ def run_scenario():
     def generate_and_stream():
         try:
             yield "INFO: Starting scenario execution...\n"
-            # Map scenario ids to filenames when they differ
-            id_to_file = {
-                'attack_scenario_orchestrator': 'attack_scenario_orchestrator.py',
-                'enterprise_attack_scenario': 'enterprise_attack_scenario.py',
-                'enterprise_attack_scenario_10min': 'enterprise_attack_scenario_10min.py',
-                'enterprise_scenario_sender': 'enterprise_scenario_sender.py',
-                'enterprise_scenario_sender_10min': 'enterprise_scenario_sender_10min.py',
-                'showcase_attack_scenario': 'showcase_attack_scenario.py',
-                'showcase_scenario_sender': 'showcase_scenario_sender.py',
-                'quick_scenario': 'quick_scenario.py',
-                'quick_scenario_simple': 'quick_scenario_simple.py',
-                'scenario_hec_sender': 'scenario_hec_sender.py',
-                'star_trek_integration_test': 'star_trek_integration_test.py',
-            }
-            scenarios_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'Backend', 'scenarios'))
             # Resolve script path
-            filename = id_to_file.get(scenario_id, f"{scenario_id}.py")
-            script_path = os.path.join(scenarios_dir, filename)
-            if not os.path.exists(script_path):
+            filename = SCENARIO_FILES.get(scenario_id, f"{scenario_id}.py")
+            script_path = _resolve_scenario_path(scenario_id)
+            if not script_path:
                 yield f"ERROR: Scenario script not found: {filename}\n"
                 return
 
@@ -343,17 +701,8 @@ def run_scenario():
             env['S1_HEC_BATCH'] = '0'  # Disable batch mode for immediate responses
             
             # Add event generators and all category subdirectories to Python path
-            event_generators_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'Backend', 'event_generators'))
-            
-            # Build list of all category directories
-            python_paths = [event_generators_dir]
-            categories = ['cloud_infrastructure', 'network_security', 'endpoint_security', 
-                         'identity_access', 'email_security', 'web_security', 'infrastructure', 'shared']
-            for category in categories:
-                category_path = os.path.join(event_generators_dir, category)
-                if os.path.exists(category_path):
-                    python_paths.append(category_path)
-            
+            python_paths = SCENARIO_PYTHONPATH
+
             # Set PYTHONPATH
             existing_pythonpath = env.get('PYTHONPATH', '')
             pythonpath_str = ':'.join(python_paths)
@@ -365,20 +714,16 @@ def run_scenario():
             logger.info(f"Set PYTHONPATH with {len(python_paths)} directories")
 
             yield f"INFO: Executing {filename} with {worker_count} parallel workers...\n"
-            import subprocess
             process = subprocess.Popen(
-                ['python', script_path],
-                cwd=scenarios_dir,
+                [sys.executable, script_path],
+                cwd=SCENARIOS_DIR,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
-                text=True,
                 env=env
             )
 
             # Stream output lines
-            for line in iter(process.stdout.readline, ''):
-                if not line:
-                    break
+            for _, line in _iter_process_lines(process):
                 yield line
 
             process.wait()
@@ -392,16 +737,158 @@ def run_scenario():
     
     return Response(stream_with_context(generate_and_stream()), mimetype='text/plain')
 
+# HEC URLs that already point at a collector endpoint and must not get the suffix appended
+_HEC_COLLECTOR_PATH = re.compile(r'/(?:event|raw)$|/services/collector')
+
+def _normalize_hec_url(u: str) -> str:
+    """Normalize HEC URL: accept bare domain and append collector path"""
+    if not u:
+        return u
+    base = u.rstrip('/')
+    if _HEC_COLLECTOR_PATH.search(base):
+        return base
+    return base + '/services/collector'
+
+# Idle syslog sockets keyed by (protocol, ip, port). A stream checks a socket out
+# for its exclusive use and checks it back in when done, so consecutive runs
+# against the same destination skip socket creation and the TCP handshake.
+# At most SYSLOG_POOL_MAX_IDLE sockets are kept per key; extras are closed on release.
+SYSLOG_POOL_MAX_IDLE = 2
+_SYSLOG_POOL = {}
+_SYSLOG_POOL_LOCK = threading.Lock()
+
+def _tcp_sock_alive(sock):
+    """Syslog servers never write back, so readable EOF/error means the peer went away"""
+    try:
+        return sock.recv(1, socket.MSG_PEEK | socket.MSG_DONTWAIT) != b''
+    except BlockingIOError:
+        return True
+    except OSError:
+        return False
+
+def _acquire_syslog_sock(protocol, ip, port):
+    key = (protocol, ip, port)
+    while True:
+        with _SYSLOG_POOL_LOCK:
+            idle = _SYSLOG_POOL.get(key)
+            sock = idle.pop() if idle else None
+        if sock is None:
+            break
+        if protocol == 'UDP' or _tcp_sock_alive(sock):
+            return sock
+        sock.close()
+
+    if protocol == 'UDP':
+        return socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    try:
+        sock.connect((ip, port))
+    except Exception:
+        sock.close()
+        raise
+    return sock
+
+def _release_syslog_sock(protocol, ip, port, sock):
+    with _SYSLOG_POOL_LOCK:
+        idle = _SYSLOG_POOL.setdefault((protocol, ip, port), [])
+        if len(idle) < SYSLOG_POOL_MAX_IDLE:
+            idle.append(sock)
+            return
+    sock.close()
+
+def _drain_syslog_pool():
+    """Close every idle pooled socket; sockets checked out by running streams are unaffected"""
+    with _SYSLOG_POOL_LOCK:
+        idle = [sock for socks in _SYSLOG_POOL.values() for sock in socks]
+        _SYSLOG_POOL.clear()
+    for sock in idle:
+        sock.close()
+
+# TCP syslog framing: 'lf' terminates each message with a newline, 'octet' uses
+# RFC 6587 octet counting ("<length> <message>") for receivers that support it
+SYSLOG_TCP_FRAMING = os.environ.get('SYSLOG_TCP_FRAMING', 'lf').lower()
+
+def _frame_tcp_syslog(message):
+    if SYSLOG_TCP_FRAMING == 'octet':
+        return b'%d ' % len(message) + message
+    return message + b'\n'
+
+# UDP syslog lines are sent in batches of this size via sendmmsg(2) on Linux
+SYSLOG_UDP_BATCH = 64
+
+class _IOVec(ctypes.Structure):
+    _fields_ = [('iov_base', ctypes.c_void_p), ('iov_len', ctypes.c_size_t)]
+
+class _MsgHdr(ctypes.Structure):
+    _fields_ = [
+        ('msg_name', ctypes.c_void_p),
+        ('msg_namelen', ctypes.c_uint32),
+        ('msg_iov', ctypes.POINTER(_IOVec)),
+        ('msg_iovlen', ctypes.c_size_t),
+        ('msg_control', ctypes.c_void_p),
+        ('msg_controllen', ctypes.c_size_t),
+        ('msg_flags', ctypes.c_int),
+    ]
+
+class _MMsgHdr(ctypes.Structure):
+    _fields_ = [('msg_hdr', _MsgHdr), ('msg_len', ctypes.c_uint)]
+
+def _load_sendmmsg():
+    if not sys.platform.startswith('linux'):
+        return None
+    try:
+        fn = ctypes.CDLL(None, use_errno=True).sendmmsg
+    except (OSError, AttributeError):
+        return None
+    fn.argtypes = [ctypes.c_int, ctypes.c_void_p, ctypes.c_uint, ctypes.c_int]
+    fn.restype = ctypes.c_int
+    return fn
+
+_sendmmsg = _load_sendmmsg()
+
+def _send_udp_batch(sock, payloads, addr):
+    """Send each payload as its own datagram to addr, in one sendmmsg(2) call where available"""
+    if _sendmmsg is None:
+        for payload in payloads:
+            sock.sendto(payload, addr)
+        return
+
+    raw_addr = (struct.pack('=H', socket.AF_INET) + struct.pack('!H', addr[1])
+                + socket.inet_aton(socket.gethostbyname(addr[0])) + bytes(8))
+    name = ctypes.create_string_buffer(raw_addr, len(raw_addr))
+    count = len(payloads)
+    iovs = (_IOVec * count)()
+    msgs = (_MMsgHdr * count)()
+    for i, payload in enumerate(payloads):
+        # payloads keeps the bytes objects alive; c_char_p points at their buffers
+        iovs[i].iov_base = ctypes.cast(ctypes.c_char_p(payload), ctypes.c_void_p)
+        iovs[i].iov_len = len(payload)
+        hdr = msgs[i].msg_hdr
+        hdr.msg_name = ctypes.addressof(name)
+        hdr.msg_namelen = len(raw_addr)
+        hdr.msg_iov = ctypes.pointer(iovs[i])
+        hdr.msg_iovlen = 1
+
+    sent = 0
+    while sent < count:
+        rc = _sendmmsg(sock.fileno(), ctypes.byref(msgs, sent * ctypes.sizeof(_MMsgHdr)), count - sent, 0)
+        if rc < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err))
+        sent += rc
+
 @app.route('/get-scripts', methods=['GET'])
 def get_available_scripts():
-    scripts = get_scripts()
-    if not scripts:
+    entry = _scripts_entry()
+    if not entry['value']:
         return jsonify({"message": "No log scripts found."}), 404
-    return jsonify(scripts)
+    return _cached_response(entry)
 
 @app.route('/generate-logs', methods=['POST'])
 def generate_logs():
-    data = request.json
+    data = _request_json()
     destination = data.get('destination', 'syslog')
     script_path = data.get('script')
     log_count = int(data.get('count', 3))
@@ -417,27 +904,25 @@ def generate_logs():
     syslog_dest_id = data.get('syslog_destination_id')
     
     if destination == 'syslog':
-        full_script_path = os.path.join(EVENT_GENERATORS_DIR, script_path)
-        if not os.path.exists(full_script_path):
+        full_script_path = _resolve_script_path(script_path)
+        if not full_script_path:
             return jsonify({'error': 'Invalid script name or path'}), 400
 
     def generate_and_stream():
         sock = None
+        sock_key = None
+        sock_ok = True
         try:
             if destination == 'syslog':
                 # Resolve syslog destination if provided
                 resolved_syslog_id = unified_dest_id if unified_dest_id else syslog_dest_id
                 if resolved_syslog_id:
                     try:
-                        dest_resp = requests.get(
-                            f"{API_BASE_URL}/api/v1/destinations/{resolved_syslog_id}",
-                            headers=_get_api_headers(),
-                            timeout=10
-                        )
-                        if dest_resp.status_code != 200 or dest_resp.json().get('type') != 'syslog':
+                        destinations, _ = _load_destinations()
+                        chosen = _resolve_destination(destinations, resolved_syslog_id)
+                        if not chosen or chosen.get('type') != 'syslog':
                             yield "ERROR: Selected syslog destination not found.\n"
                             return
-                        chosen = dest_resp.json()
                         syslog_ip_local = chosen.get('ip')
                         syslog_port_local = int(chosen.get('port') or 0)
                         syslog_protocol_local = (chosen.get('protocol') or '').upper()
@@ -453,45 +938,61 @@ def generate_logs():
                     yield "ERROR: Missing or invalid syslog destination details.\n"
                     return
 
-                if syslog_protocol_local == 'UDP':
-                    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-                elif syslog_protocol_local == 'TCP':
-                    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                    try:
-                        sock.connect((syslog_ip_local, syslog_port_local))
-                    except Exception as e:
-                        yield f"ERROR: Could not connect to TCP syslog server at {syslog_ip_local}:{syslog_port_local}. Details: {e}\n"
-                        return
-                else:
-                    yield "ERROR: Invalid syslog protocol. Please select TCP or UDP.\n"
+                sock_key = (syslog_protocol_local, syslog_ip_local, syslog_port_local)
+                try:
+                    sock = _acquire_syslog_sock(*sock_key)
+                except Exception as e:
+                    yield f"ERROR: Could not connect to TCP syslog server at {syslog_ip_local}:{syslog_port_local}. Details: {e}\n"
                     return
 
                 yield "INFO: Starting log generation...\n"
 
-                command = ['python', full_script_path, str(log_count)]
+                command = [sys.executable, full_script_path, str(log_count)]
                 process = subprocess.Popen(
                     command,
                     stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    text=True
+                    stderr=subprocess.PIPE
                 )
 
-                for line in iter(process.stdout.readline, ''):
+                pending_udp = []
+                error_lines = []
+                for stream_name, line in _iter_process_lines(process):
+                    if stream_name == 'stderr':
+                        error_lines.append(line)
+                        continue
                     if line:
                         log_line = line.strip()
                         try:
                             if syslog_protocol_local == 'UDP':
-                                sock.sendto(bytes(log_line + '\n', 'utf-8'), (syslog_ip_local, syslog_port_local))
+                                pending_udp.append(bytes(log_line + '\n', 'utf-8'))
+                                if len(pending_udp) >= SYSLOG_UDP_BATCH:
+                                    _send_udp_batch(sock, pending_udp, (syslog_ip_local, syslog_port_local))
+                                    pending_udp = []
                             else:
-                                sock.sendall(bytes(log_line + '\n', 'utf-8'))
+                                payload = _frame_tcp_syslog(log_line.encode('utf-8'))
+                                try:
+                                    sock.sendall(payload)
+                                except (BrokenPipeError, ConnectionResetError):
+                                    # Pooled connection dropped by the server since checkout; reconnect once
+                                    sock.close()
+                                    sock = _acquire_syslog_sock(*sock_key)
+                                    sock.sendall(payload)
                         except Exception as e:
+                            sock_ok = False
                             yield f"ERROR: Failed to send log to syslog server. Details: {e}\n"
                             process.terminate()
                             break
 
                         yield f"LOG: {log_line}\n"
 
-                errors = process.stderr.read()
+                if pending_udp and sock_ok:
+                    try:
+                        _send_udp_batch(sock, pending_udp, (syslog_ip_local, syslog_port_local))
+                    except Exception as e:
+                        sock_ok = False
+                        yield f"ERROR: Failed to send log to syslog server. Details: {e}\n"
+
+                errors = ''.join(error_lines)
                 if errors:
                     yield f"ERROR: Script execution produced errors:\n{errors}\n"
 
@@ -507,28 +1008,18 @@ def generate_logs():
                 resolved_hec_id = unified_dest_id if unified_dest_id else hec_dest_id
                 
                 try:
+                    destinations, _ = _load_destinations()
                     if resolved_hec_id:
                         # Get specific destination
-                        dest_resp = requests.get(
-                            f"{API_BASE_URL}/api/v1/destinations/{resolved_hec_id}",
-                            headers=_get_api_headers(),
-                            timeout=10
-                        )
-                        if dest_resp.status_code != 200 or dest_resp.json().get('type') != 'hec':
+                        chosen = _resolve_destination(destinations, resolved_hec_id)
+                        if not chosen or chosen.get('type') != 'hec':
                             yield "ERROR: Selected HEC destination not found.\n"
                             return
-                        chosen = dest_resp.json()
                     else:
                         # Get first HEC destination
-                        list_resp = requests.get(
-                            f"{API_BASE_URL}/api/v1/destinations",
-                            headers=_get_api_headers(),
-                            timeout=10
-                        )
-                        if list_resp.status_code != 200:
+                        if destinations is None:
                             yield "ERROR: Failed to fetch destinations from backend.\n"
                             return
-                        destinations = list_resp.json()
                         hec_dests = [d for d in destinations if d.get('type') == 'hec']
                         if not hec_dests:
                             yield "ERROR: No HEC destination configured. Add one in Settings > Destinations.\n"
@@ -539,17 +1030,11 @@ def generate_logs():
                     dest_id = chosen.get('id')
                     
                     # Fetch decrypted token from backend
-                    token_resp = requests.get(
-                        f"{API_BASE_URL}/api/v1/destinations/{dest_id}/token",
-                        headers=_get_api_headers(),
-                        timeout=10
-                    )
-                    if token_resp.status_code != 200:
+                    hec_token, token_status = _get_hec_token(dest_id, hec_url)
+                    if token_status != 200:
                         yield "ERROR: Failed to retrieve HEC token from backend.\n"
                         return
                     
-                    hec_token = token_resp.json().get('token')
-                    
                     if not hec_url or not hec_token:
                         yield "ERROR: Selected HEC destination is incomplete or token missing.\n"
                         return
@@ -571,18 +1056,6 @@ def generate_logs():
                     yield "ERROR: HEC sender not found.\n"
                     return
 
-                # Normalize HEC URL: accept bare domain and append collector path
-                def _normalize_hec_url(u: str) -> str:
-                    if not u:
-                        return u
-                    base = u.rstrip('/')
-                    if base.endswith('/event') or base.endswith('/raw'):
-                        return base
-                    # If already includes /services/collector, keep it
-                    if '/services/collector' in base:
-                        return base
-                    return base + '/services/collector'
-
                 normalized_hec_url = _normalize_hec_url(hec_url)
                 logger.info(f"Normalized HEC URL: {normalized_hec_url}")
 
@@ -596,31 +1069,35 @@ def generate_logs():
 
                 # Calculate delay from EPS: delay = 1 / eps
                 delay = 1.0 / eps if eps > 0 else 1.0
-                command = ['python3', hec_sender_path, '--product', product_id, '-n', str(log_count), 
+                command = [sys.executable, hec_sender_path, '--product', product_id, '-n', str(log_count), 
                            '--min-delay', str(delay), '--max-delay', str(delay), '--print-responses']
                 logger.info(f"Executing HEC sender: {' '.join(command)}")
                 process = subprocess.Popen(
                     command,
                     stdout=subprocess.PIPE,
                     stderr=subprocess.PIPE,
-                    text=True,
                     env=env
                 )
 
                 # Stream sanitized output
                 line_count = 0
-                for line in iter(process.stdout.readline, ''):
-                    if not line:
-                        break
+                stderr_lines = []
+                # Checked once so the per-line debug message is only built when it will be emitted
+                debug_enabled = logger.isEnabledFor(logging.DEBUG)
+                for stream_name, line in _iter_process_lines(process):
+                    if stream_name == 'stderr':
+                        stderr_lines.append(line)
+                        continue
                     line_count += 1
                     # Redact token from output
                     sanitized = line.replace(hec_token, '***REDACTED***')
                     yield sanitized
-                    logger.debug(f"HEC sender output line {line_count}: {sanitized.strip()}")
+                    if debug_enabled:
+                        logger.debug(f"HEC sender output line {line_count}: {sanitized.strip()}")
 
                 # Capture any errors or additional output
                 process.wait()
-                stderr_output = process.stderr.read() if process.stderr else ""
+                stderr_output = ''.join(stderr_lines)
                 logger.info(f"HEC sender process completed with return code: {process.returncode}")
                 
                 if stderr_output:
@@ -646,10 +1123,15 @@ def generate_logs():
             logger.info("Log generation complete")
             yield "INFO: Log generation complete.\n"
             if sock:
-                sock.close()
+                if sock_ok:
+                    _release_syslog_sock(*sock_key, sock)
+                else:
+                    sock.close()
 
     return Response(stream_with_context(generate_and_stream()), mimetype='text/plain')
 
 if __name__ == '__main__':
-    app.run(debug=True, host='0.0.0.0', port=8000)
+    # Development server only; production runs under gunicorn (see Frontend/Dockerfile)
+    debug = os.environ.get('FLASK_DEBUG', 'false').lower() in ('true', '1', 'yes')
+    app.run(debug=debug, host='0.0.0.0', port=8000, threaded=True)
 